@@ -1,6 +1,5 @@
 import streamlit as st
-import pandas as pd
-from utils.data_loader import load_ethics_db, load_knowledge_graph, load_system_event_log
+from utils.data_loader import build_ethics_chart_data, build_ethics_df, count_ethics_events, load_ethics_db, load_ethics_trend_summary, load_knowledge_graph, load_system_event_table, load_system_event_types, prefetch_data
 
 # Placeholder paths for Sophia_Alpha2 data files
 # In a real scenario, these might be configurable or detected.
@@ -13,22 +12,23 @@ SOPHIA_SYSTEM_LOG_PATH = "../Sophia_Alpha2/data/logs/system_events.log"
 # Number of log entries to display by default
 NUM_LOG_ENTRIES_DISPLAY = 20
 
+# Below this many ethical events the chart is built from plain lists instead of a DataFrame
+SMALL_EVENTS_CHART_THRESHOLD = 256
+
 # --- Page Implementations ---
 
 def ethical_trends_page():
     st.title("Ethical Trends Analysis")
 
-    # Load ethics data
-    ethics_data = load_ethics_db(SOPHIA_ETHICS_DB_PATH)
+    # Load the trend summary first; from a current Parquet side-file it is read without decoding the JSON
+    trend_summary, summary_loaded = load_ethics_trend_summary(SOPHIA_ETHICS_DB_PATH)
 
-    if not ethics_data or not ethics_data.get("ethical_events"):
+    if not summary_loaded:
         st.warning("No ethical events data loaded or data is empty. Cannot display trends.")
-        # Optionally, display the error messages captured by load_ethics_db if they are stored
-        # or use a more specific check if load_ethics_db returns more info on error
+        # load_ethics_trend_summary has already displayed the specific file error
         return
 
     # Display trend analysis summary
-    trend_summary = ethics_data.get("trend_analysis", {})
     if trend_summary:
         st.subheader("Trend Analysis Summary")
         col1, col2 = st.columns(2)
@@ -39,36 +39,33 @@ def ethical_trends_page():
     else:
         st.info("No trend analysis summary available in the data.")
 
-    # Prepare data for charting
-    events = ethics_data["ethical_events"]
-    if not events:
+    # Prepare data for charting. The event count comes from the Parquet side-file when it is current,
+    # so large DBs are charted from the side-file without decoding the JSON at all
+    num_events = count_ethics_events(SOPHIA_ETHICS_DB_PATH)
+    if num_events == 0:
         st.info("No ethical events recorded to display.")
         return
 
-    # Convert to DataFrame for easier manipulation and charting
     # Ensure timestamps are converted to datetime objects for proper sorting and charting
     try:
-        df_ethics = pd.DataFrame(events)
-        if 'timestamp' not in df_ethics.columns:
+        if num_events < SMALL_EVENTS_CHART_THRESHOLD:
+            # Few events: sorted plain lists are cheaper than building a DataFrame
+            events = load_ethics_db(SOPHIA_ETHICS_DB_PATH).get("ethical_events", [])
+            chart_data = build_ethics_chart_data(events)
+        else:
+            # build_ethics_df converts timestamps to datetime and sorts by time once per file version
+            chart_data = build_ethics_df(SOPHIA_ETHICS_DB_PATH)
+        if 'timestamp' not in chart_data:
             st.error("Error: 'timestamp' column missing in ethical events data.")
             return
-        if 'final_score' not in df_ethics.columns:
+        if 'final_score' not in chart_data:
             st.error("Error: 'final_score' column missing in ethical events data.")
             return
 
-        df_ethics['timestamp'] = pd.to_datetime(df_ethics['timestamp'])
-        df_ethics = df_ethics.sort_values(by='timestamp') # Sort by time for the line chart
-
         st.subheader("Ethical Score Over Time")
-        # Use st.line_chart, ensuring 'timestamp' is the index or x-axis
-        # and 'final_score' is the y-axis.
-        # st.line_chart expects the DataFrame index to be the x-axis if only one column is passed for y.
-        # Or specify x and y.
-        
-        # Create a chart with 'timestamp' as x and 'final_score' as y
-        # Create a new DataFrame with 'timestamp' as index for st.line_chart
-        chart_df = df_ethics.set_index('timestamp')[['final_score']]
-        st.line_chart(chart_df)
+        # Create a chart with 'timestamp' as x and 'final_score' as y.
+        # Passing x and y directly avoids building a re-indexed copy of the chart data.
+        st.line_chart(chart_data, x='timestamp', y='final_score')
 
     except Exception as e:
         st.error(f"An error occurred while preparing data for the chart: {e}")
@@ -81,8 +78,9 @@ def knowledge_graph_explorer_page():
 
     # Load KG data
     kg_data = load_knowledge_graph(SOPHIA_KG_PATH)
+    kg_loaded_ok = bool(kg_data) and ("nodes" in kg_data or "edges" in kg_data)
 
-    if not kg_data or ("nodes" not in kg_data and "edges" not in kg_data) :
+    if not kg_loaded_ok:
         # load_knowledge_graph returns {"nodes": [], "edges": []} on error,
         # so check if both are potentially empty or if the dict itself is empty.
         st.warning("Knowledge graph data could not be loaded or is empty.")
@@ -96,7 +94,7 @@ def knowledge_graph_explorer_page():
     col1.metric("Total Nodes", num_nodes)
     col2.metric("Total Edges", num_edges)
 
-    if num_nodes == 0 and num_edges == 0 and not load_knowledge_graph(SOPHIA_KG_PATH): # Check if it was an actual error
+    if num_nodes == 0 and num_edges == 0: # load_knowledge_graph returns an empty graph on error
         st.info("Consider checking file paths or content if you expected data.")
 
 
@@ -114,49 +112,69 @@ def knowledge_graph_explorer_page():
 def system_event_log_viewer_page():
     st.title("System Event Log Viewer")
 
-    # Load system event log data
-    log_entries = load_system_event_log(SOPHIA_SYSTEM_LOG_PATH)
+    # Offer the event_types present in the recent end of the log, which the tail view shows.
+    # Only that bounded region is scanned, so a growing log doesn't slow down every rerun.
+    severity_levels = load_system_event_types(SOPHIA_SYSTEM_LOG_PATH)
+    selected_severities = st.multiselect("Filter by severity", severity_levels, default=severity_levels,
+                                         help="Levels are taken from the most recent part of the log. "
+                                              "Entries without an event_type are always shown.")
+    # Filtering happens on the raw log lines, so excluded entries are never parsed.
+    # With every level selected nothing is excluded, so no filter is passed (matching the prefetched load).
+    severity_filter = None
+    if set(selected_severities) != set(severity_levels):
+        severity_filter = {severity.encode() for severity in selected_severities}
 
-    if not log_entries:
-        st.warning("No system event log data loaded or the log is empty.")
-        # Optionally, display messages if load_system_event_log recorded specific file errors
+    # Load system event log data
+    # Load only the most recent entries; the file is read backwards from the end
+    log_table = load_system_event_table(SOPHIA_SYSTEM_LOG_PATH, max_entries=NUM_LOG_ENTRIES_DISPLAY,
+                                        severity_filter=severity_filter)
+
+    if log_table.num_rows == 0:
+        if severity_filter is not None:
+            st.info("No log entries match the selected severity levels.")
+        else:
+            st.warning("No system event log data loaded or the log is empty.")
+        # Optionally, display messages if load_system_event_table recorded specific file errors
         return
 
     st.subheader(f"Last {NUM_LOG_ENTRIES_DISPLAY} Log Entries")
     
-    # Display the last N entries. Assuming log_entries is a list of dicts.
-    # Using a DataFrame for a nice tabular display.
-    if isinstance(log_entries, list) and len(log_entries) > 0:
-        df_logs = pd.DataFrame(log_entries)
-        # Ensure chronological order if timestamps are reliable and consistent
-        # For now, just taking the last N as they are loaded (which might be reversed if appended to)
-        # If logs are appended, the last N entries in the file are the most recent.
-        st.dataframe(df_logs.tail(NUM_LOG_ENTRIES_DISPLAY), height=300) # Use st.dataframe for scrollability
-    else:
-        st.info("Log data is not in the expected list format or is empty.")
+    # Display the last N entries. The table is already tail-limited and st.dataframe
+    # serializes via Arrow, so it is passed directly without a pandas round-trip.
+    # Entries are returned in file order; if logs are appended, the last N entries in the file are the most recent.
+    st.dataframe(log_table, height=300) # Use st.dataframe for scrollability
 
     st.subheader("Future Enhancements")
     st.text_area("Filtering and Searching Placeholder",
-                 "Future versions of this tool will include capabilities to filter logs by severity (INFO, WARNING, ERROR), "
-                 "search by keywords, and select date ranges.",
+                 "Future versions of this tool will include capabilities to search logs by keywords "
+                 "and select date ranges.",
                  height=100)
 
 # --- Main Application Setup ---
 
+# Sidebar label -> page function
+PAGE_OPTIONS = {
+    "Ethical Trends": ethical_trends_page,
+    "Knowledge Graph Explorer": knowledge_graph_explorer_page,
+    "System Event Log Viewer": system_event_log_viewer_page,
+}
+
 def main():
     st.set_page_config(page_title="Sophia Toolkit", layout="wide")
 
-    st.sidebar.title("Sophia Toolkit Navigation")
-    page_options = {
-        "Ethical Trends": ethical_trends_page,
-        "Knowledge Graph Explorer": knowledge_graph_explorer_page,
-        "System Event Log Viewer": system_event_log_viewer_page,
-    }
+    # On a session's first run, start loading all three data files concurrently so
+    # their reads overlap; each page then hits the loader cache instead of reading sequentially.
+    if "data_prefetched" not in st.session_state:
+        prefetch_data(SOPHIA_ETHICS_DB_PATH, SOPHIA_KG_PATH, SOPHIA_SYSTEM_LOG_PATH,
+                      max_log_entries=NUM_LOG_ENTRIES_DISPLAY,
+                      ethics_df_min_events=SMALL_EVENTS_CHART_THRESHOLD)
+        st.session_state["data_prefetched"] = True
 
-    selected_page = st.sidebar.radio("Go to", list(page_options.keys()))
+    st.sidebar.title("Sophia Toolkit Navigation")
+    selected_page = st.sidebar.radio("Go to", list(PAGE_OPTIONS.keys()))
 
     # Display the selected page
-    page_options[selected_page]()
+    PAGE_OPTIONS[selected_page]()
 
 if __name__ == "__main__":
     main()
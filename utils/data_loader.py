@@ -1,10 +1,80 @@
 import json
+import logging
+import mmap
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 import pandas as pd
+import pyarrow as pa
+import pyarrow.json as paj
+import pyarrow.parquet as pq
 import streamlit as st # For displaying warnings/errors in the UI
 
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError: # orjson is optional; fall back to the standard library parser
+    orjson = None
+    _json_loads = json.loads
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so the handlers below catch both.
+
+# Pulls the event_type out of a raw log line so severity filtering can skip lines before JSON decoding
+_SEVERITY_RE = re.compile(rb'"event_type"\s*:\s*"(\w+)"')
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError: # ciso8601 is optional; datetime.fromisoformat handles ISO-8601 on Python 3.11+
+    _parse_iso_datetime = datetime.fromisoformat
+
+def _show_messages(messages):
+    """
+    Displays (level, text) messages collected by a cached loader, e.g. ("error", "...").
+    Cached loaders return their messages instead of calling st.warning/st.error themselves,
+    so they stay safe to run from prefetch worker threads and messages are shown on every cache hit.
+    """
+    for level, text in messages:
+        getattr(st, level)(text)
+
+def _safe_stat(file_path):
+    """
+    Stats file_path without raising.
+
+    Returns:
+        tuple: (exists, mtime, size). mtime and size are None if the file does not exist.
+               mtime is used as part of the cache key so cached results are invalidated when the file changes.
+    """
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
+        return False, None, None
+    return True, stat_result.st_mtime, stat_result.st_size
+
+def _load_json_mapped(f):
+    """
+    Decodes the JSON document in the open binary file f.
+    With orjson the file is memory-mapped and parsed in place, so no intermediate
+    copy of the file contents is made; pages are read in by the OS as the parser reaches them.
+    """
+    if orjson is None or os.fstat(f.fileno()).st_size == 0: # mmap cannot map an empty file
+        return _json_loads(f.read())
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+        return orjson.loads(view)
+
+def _validate_ethics_shape(data):
+    """Returns True if data has the structure expected from ethics_db.json."""
+    return isinstance(data, dict) and "ethical_events" in data
+
+def _validate_kg_shape(data):
+    """Returns True if data has the structure expected from knowledge_graph.json."""
+    return isinstance(data, dict) and "nodes" in data and "edges" in data
+
 def load_ethics_db(file_path):
     """
     Safely loads and parses the ethics_db.json file.
+    Results are cached per file path and modification time.
 
     Args:
         file_path (str): The path to the ethics_db.json file.
@@ -13,26 +83,253 @@ def load_ethics_db(file_path):
         dict: Parsed JSON data, or an empty dict if loading fails.
               Expected structure: {"ethical_events": [...], "trend_analysis": {...}}
     """
-    try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        if not isinstance(data, dict) or "ethical_events" not in data:
-            st.warning(f"Warning: {file_path} does not contain the expected 'ethical_events' key or is not a dictionary.")
-            return {"ethical_events": [], "trend_analysis": {}} # Return default structure
-        return data
-    except FileNotFoundError:
+    exists, mtime, _ = _safe_stat(file_path)
+    if not exists:
         st.error(f"Error: Ethics DB file not found at {file_path}. Please check the path.")
         return {"ethical_events": [], "trend_analysis": {}}
+    data, messages = _load_ethics_db_cached(file_path, mtime)
+    _show_messages(messages)
+    return data
+
+@st.cache_data(show_spinner=False)
+def _load_ethics_db_cached(file_path, mtime):
+    messages = []
+    try:
+        with open(file_path, 'rb') as f:
+            data = _json_loads(f.read())
+        if not _validate_ethics_shape(data): # Runs on cache misses only
+            messages.append(("warning", f"Warning: {file_path} does not contain the expected 'ethical_events' key or is not a dictionary."))
+            return {"ethical_events": [], "trend_analysis": {}}, messages # Return default structure
+        return data, messages
+    except FileNotFoundError:
+        messages.append(("error", f"Error: Ethics DB file not found at {file_path}. Please check the path."))
+        return {"ethical_events": [], "trend_analysis": {}}, messages
     except json.JSONDecodeError:
-        st.error(f"Error: Could not decode JSON from {file_path}. The file might be corrupted or empty.")
-        return {"ethical_events": [], "trend_analysis": {}}
+        messages.append(("error", f"Error: Could not decode JSON from {file_path}. The file might be corrupted or empty."))
+        return {"ethical_events": [], "trend_analysis": {}}, messages
     except Exception as e:
-        st.error(f"An unexpected error occurred while loading {file_path}: {e}")
-        return {"ethical_events": [], "trend_analysis": {}}
+        messages.append(("error", f"An unexpected error occurred while loading {file_path}: {e}"))
+        return {"ethical_events": [], "trend_analysis": {}}, messages
+
+# Parquet side-file metadata keys: the ethics_db.json mtime it was built from, and its trend_analysis
+_PARQUET_SOURCE_MTIME_KEY = b'sophia_source_mtime'
+_PARQUET_TREND_ANALYSIS_KEY = b'sophia_trend_analysis'
+
+def _ethics_parquet_path(file_path):
+    """Returns the path of the Parquet side-file caching the ethics DataFrame for file_path."""
+    return os.path.splitext(file_path)[0] + '.parquet'
+
+def _arrow_dtype_except_timestamps(arrow_type):
+    """types_mapper for to_pandas matching build_ethics_df: Arrow-backed columns, numpy datetimes."""
+    return None if pa.types.is_timestamp(arrow_type) else pd.ArrowDtype(arrow_type)
+
+def _open_current_ethics_parquet(parquet_path, mtime):
+    """
+    Opens parquet_path if it was built from the ethics_db.json version with
+    modification time mtime. Only the file footer is read.
+
+    Returns:
+        tuple: (pq.ParquetFile, metadata dict), or None if the side-file is missing, stale or unreadable.
+    """
+    try:
+        parquet_file = pq.ParquetFile(parquet_path)
+    except (OSError, pa.ArrowException):
+        return None
+    metadata = parquet_file.schema_arrow.metadata or {}
+    if metadata.get(_PARQUET_SOURCE_MTIME_KEY) != repr(mtime).encode():
+        return None # Stale or foreign side-file
+    return parquet_file, metadata
+
+def _read_ethics_parquet(parquet_path, mtime):
+    """
+    Returns the ethics DataFrame stored in parquet_path if it was built from the
+    ethics_db.json version with modification time mtime, otherwise None.
+    """
+    opened = _open_current_ethics_parquet(parquet_path, mtime)
+    if opened is None:
+        return None
+    try:
+        return opened[0].read().to_pandas(types_mapper=_arrow_dtype_except_timestamps)
+    except (OSError, pa.ArrowException):
+        return None
+
+def _write_ethics_parquet(parquet_path, df_ethics, mtime, trend_analysis):
+    """
+    Writes df_ethics to parquet_path with zstd compression, recording mtime and
+    trend_analysis in the file metadata. The side-file is only a cache, so failures
+    (e.g. a read-only data directory) are ignored and the JSON remains authoritative.
+    """
+    tmp_path = f"{parquet_path}.{os.getpid()}.tmp"
+    try:
+        table = pa.Table.from_pandas(df_ethics, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_PARQUET_SOURCE_MTIME_KEY] = repr(mtime).encode()
+        metadata[_PARQUET_TREND_ANALYSIS_KEY] = json.dumps(trend_analysis).encode()
+        pq.write_table(table.replace_schema_metadata(metadata), tmp_path, compression='zstd')
+        os.replace(tmp_path, parquet_path) # Readers never see a partially written file
+    except (OSError, TypeError, ValueError, pa.ArrowException):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def load_ethics_trend_summary(file_path):
+    """
+    Loads the 'trend_analysis' object from the ethics_db.json file. When the Parquet side-file
+    is current it is read from the side-file metadata without decoding the JSON; otherwise it
+    comes from the cached load_ethics_db result, which the page needs for its events anyway.
+    Results are cached per file path and modification time.
+
+    Args:
+        file_path (str): The path to the ethics_db.json file.
+
+    Returns:
+        tuple: (trend_summary, loaded_ok). trend_summary is the trend analysis dict, or {} if the
+               file has none (missing or null). loaded_ok is False if the file could not be loaded.
+    """
+    exists, mtime, _ = _safe_stat(file_path)
+    if not exists:
+        st.error(f"Error: Ethics DB file not found at {file_path}. Please check the path.")
+        return {}, False
+    trend_summary, loaded_ok, messages = _load_ethics_trend_summary_cached(file_path, mtime)
+    _show_messages(messages)
+    return trend_summary, loaded_ok
+
+def _as_trend_summary(value):
+    """Normalizes a decoded 'trend_analysis' value: anything but a dict (e.g. null) becomes {}."""
+    return value if isinstance(value, dict) else {}
+
+@st.cache_data(show_spinner=False)
+def _load_ethics_trend_summary_cached(file_path, mtime):
+    opened = _open_current_ethics_parquet(_ethics_parquet_path(file_path), mtime)
+    if opened is not None and _PARQUET_TREND_ANALYSIS_KEY in opened[1]:
+        return _as_trend_summary(_json_loads(opened[1][_PARQUET_TREND_ANALYSIS_KEY])), True, []
+
+    # The page loads the full DB for its events in the same run anyway, so the summary is taken
+    # from that cached load rather than a separate pass over the file. This is the page's first
+    # read, so every load message is reported here; a load with messages has no events, and the
+    # page only calls load_ethics_db when there are events, so each message is shown once
+    ethics_data, messages = _load_ethics_db_cached(file_path, mtime)
+    loaded_ok = not any(level == "error" for level, _ in messages)
+    return _as_trend_summary(ethics_data.get("trend_analysis")), loaded_ok, messages
+
+def count_ethics_events(file_path):
+    """
+    Returns the number of ethical events in the ethics_db.json file. When the Parquet side-file
+    is current the count is its row count, read from the file footer without decoding the JSON;
+    otherwise it comes from the cached load_ethics_db result. Load problems are not shown here,
+    since load_ethics_trend_summary reports them. Results are cached per file path and modification time.
+
+    Args:
+        file_path (str): The path to the ethics_db.json file.
+
+    Returns:
+        int: The number of events, or 0 if the file is missing or could not be loaded.
+    """
+    exists, mtime, _ = _safe_stat(file_path)
+    if not exists:
+        return 0
+    return _count_ethics_events_cached(file_path, mtime)
+
+@st.cache_data(show_spinner=False)
+def _count_ethics_events_cached(file_path, mtime):
+    opened = _open_current_ethics_parquet(_ethics_parquet_path(file_path), mtime)
+    if opened is not None:
+        return opened[0].metadata.num_rows
+    ethics_data, _ = _load_ethics_db_cached(file_path, mtime)
+    return len(ethics_data.get("ethical_events", []))
+
+def build_ethics_df(file_path):
+    """
+    Builds a DataFrame of ethical events from the ethics_db.json file,
+    with timestamps converted to datetime and rows sorted by time.
+    Results are cached per file path and modification time. The DataFrame is also
+    written to an ethics_db.parquet side-file, which later loads (including after an
+    app restart) read instead of decoding the JSON while the JSON is unchanged.
+
+    Args:
+        file_path (str): The path to the ethics_db.json file.
+
+    Returns:
+        pd.DataFrame: One row per ethical event. Empty if no events could be loaded.
+    """
+    exists, mtime, _ = _safe_stat(file_path)
+    if not exists:
+        return pd.DataFrame()
+    return _build_ethics_df_cached(file_path, mtime)
+
+@st.cache_data(show_spinner=False)
+def _build_ethics_df_cached(file_path, mtime):
+    parquet_path = _ethics_parquet_path(file_path)
+    df_ethics = _read_ethics_parquet(parquet_path, mtime)
+    if df_ethics is not None:
+        return df_ethics # Side-file matches this JSON version; skip JSON decoding entirely
+
+    # Load problems are reported by the caller's load_ethics_trend_summary call, so messages aren't shown here
+    ethics_data, load_messages = _load_ethics_db_cached(file_path, mtime)
+    events = ethics_data.get("ethical_events", [])
+    try:
+        # Build columns in Arrow rather than inferring dtypes row by row from the list of dicts
+        df_ethics = pa.Table.from_pylist(events).to_pandas(types_mapper=pd.ArrowDtype)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        df_ethics = pd.DataFrame(events) # Mixed-type fields that Arrow can't represent as one column
+    if 'timestamp' in df_ethics.columns:
+        # Sophia_Alpha2 writes ISO-8601 timestamps; an explicit format keeps pandas on its
+        # vectorized parser instead of falling back to per-element inference.
+        # Events are often logged in bursts sharing a timestamp, so each distinct string is parsed once.
+        uniques = pd.unique(df_ethics['timestamp'])
+        parsed = pd.to_datetime(uniques, format='ISO8601', utc=True)
+        df_ethics['timestamp'] = df_ethics['timestamp'].map(dict(zip(uniques, parsed)))
+        df_ethics = df_ethics.sort_values(by='timestamp', ignore_index=True) # Sort by time for the line chart
+    if not load_messages: # Don't cache the empty fallback for a file that failed to load
+        _write_ethics_parquet(parquet_path, df_ethics, mtime, ethics_data.get("trend_analysis", {}))
+    return df_ethics
+
+def _parse_utc_timestamp(value):
+    """
+    Parses an ISO-8601 timestamp into a UTC datetime the way pd.to_datetime(..., utc=True) does:
+    offsets are converted to UTC and naive values are taken to be UTC. None stays None.
+    """
+    if value is None:
+        return None
+    parsed = _parse_iso_datetime(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+def build_ethics_chart_data(events):
+    """
+    Builds time-sorted chart columns from a small list of ethical events using plain lists,
+    skipping the fixed cost of DataFrame construction, datetime conversion and sorting.
+    Produces the same data as build_ethics_df: timestamps in UTC, and events missing a
+    field are kept with None in its place (sorted last when the timestamp is missing).
+
+    Args:
+        events (list): The 'ethical_events' list from load_ethics_db.
+
+    Returns:
+        dict: {"timestamp": [...], "final_score": [...]} sorted by time, suitable for st.line_chart.
+              A key is omitted if no event has that field.
+    """
+    has_timestamp = any('timestamp' in event for event in events)
+    has_score = any('final_score' in event for event in events)
+    if not (has_timestamp and has_score):
+        present = (('timestamp', has_timestamp), ('final_score', has_score))
+        return {key: [] for key, is_present in present if is_present}
+    timestamps = [_parse_utc_timestamp(event.get('timestamp')) for event in events]
+    scores = [event.get('final_score') for event in events]
+    # Sort by time for the line chart; missing timestamps go last, like NaT in sort_values
+    earliest = datetime.min.replace(tzinfo=timezone.utc)
+    order = sorted(range(len(timestamps)), key=lambda i: (timestamps[i] is None, timestamps[i] or earliest))
+    return {
+        'timestamp': [timestamps[i] for i in order],
+        'final_score': [scores[i] for i in order],
+    }
 
 def load_knowledge_graph(file_path):
     """
     Safely loads and parses the knowledge_graph.json file.
+    Results are cached per file path and modification time.
 
     Args:
         file_path (str): The path to the knowledge_graph.json file.
@@ -41,49 +338,335 @@ def load_knowledge_graph(file_path):
         dict: Parsed JSON data, or an empty dict with 'nodes' and 'edges' keys if loading fails.
               Expected structure: {"nodes": [...], "edges": [...]}
     """
-    try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        if not isinstance(data, dict) or "nodes" not in data or "edges" not in data:
-            st.warning(f"Warning: {file_path} does not contain 'nodes' and 'edges' keys or is not a dictionary.")
-            return {"nodes": [], "edges": []} # Return default structure
-        return data
-    except FileNotFoundError:
+    exists, mtime, _ = _safe_stat(file_path)
+    if not exists:
         st.error(f"Error: Knowledge Graph file not found at {file_path}. Please check the path.")
         return {"nodes": [], "edges": []}
+    data, messages = _load_knowledge_graph_cached(file_path, mtime)
+    _show_messages(messages)
+    return data
+
+@st.cache_data(show_spinner=False)
+def _load_knowledge_graph_cached(file_path, mtime):
+    messages = []
+    try:
+        with open(file_path, 'rb') as f:
+            data = _load_json_mapped(f) # Knowledge graphs can be large; avoid a full bytes copy
+        if not _validate_kg_shape(data): # Runs on cache misses only
+            messages.append(("warning", f"Warning: {file_path} does not contain 'nodes' and 'edges' keys or is not a dictionary."))
+            return {"nodes": [], "edges": []}, messages # Return default structure
+        return data, messages
+    except FileNotFoundError:
+        messages.append(("error", f"Error: Knowledge Graph file not found at {file_path}. Please check the path."))
+        return {"nodes": [], "edges": []}, messages
     except json.JSONDecodeError:
-        st.error(f"Error: Could not decode JSON from {file_path}. The file might be corrupted or empty.")
-        return {"nodes": [], "edges": []}
+        messages.append(("error", f"Error: Could not decode JSON from {file_path}. The file might be corrupted or empty."))
+        return {"nodes": [], "edges": []}, messages
     except Exception as e:
-        st.error(f"An unexpected error occurred while loading {file_path}: {e}")
-        return {"nodes": [], "edges": []}
+        messages.append(("error", f"An unexpected error occurred while loading {file_path}: {e}"))
+        return {"nodes": [], "edges": []}, messages
+
+def _iter_lines_reversed(file_path):
+    """
+    Yields the raw lines (bytes) of file_path from last to first.
+    The file is memory-mapped so only the pages holding the lines actually consumed are read.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            if mm[end - 1:end] == b'\n':
+                end -= 1 # Don't count the terminating newline as an empty last line
+            while end > 0:
+                start = mm.rfind(b'\n', 0, end) + 1
+                yield mm[start:end]
+                end = start - 1
+
+def _keep_log_line(line, severity_filter):
+    """
+    Returns False for empty lines and for lines whose event_type is not in severity_filter.
+    The check runs on the raw bytes, so rejected lines are never JSON-decoded.
+    Lines without a recognizable event_type are kept.
+    """
+    if not line.strip():
+        return False
+    if severity_filter is not None:
+        match = _SEVERITY_RE.search(line)
+        if match and match.group(1) not in severity_filter:
+            return False
+    return True
+
+def _decode_log_line(line):
+    """
+    Decodes one log line and parses its 'timestamp' field into a UTC datetime where possible,
+    so callers get a proper datetime column without further conversion. Timestamps are
+    normalized like the Arrow reader's timestamp[us, tz=UTC] column, so both paths agree.
+    Returns None if the line is valid JSON but not an object (e.g. [1, 2] or 42).
+    Raises json.JSONDecodeError if the line is not valid JSON.
+    """
+    entry = _json_loads(line)
+    if not isinstance(entry, dict):
+        return None
+    if isinstance(entry.get('timestamp'), str):
+        try:
+            entry['timestamp'] = _parse_utc_timestamp(entry['timestamp'])
+        except ValueError:
+            pass # Keep the raw string if the timestamp is not ISO-8601
+    return entry
 
-def load_system_event_log(file_path):
+# How much of the end of the log load_system_event_types scans. A live log changes on almost
+# every rerun, so the scan is bounded to keep it independent of the log's total size.
+_EVENT_TYPES_SCAN_BYTES = 1 << 20
+
+def load_system_event_types(file_path):
+    """
+    Returns the distinct event_type values in the most recent part of a system_events.log file
+    (its last _EVENT_TYPES_SCAN_BYTES), for building a severity filter over the log tail.
+    The memory-mapped region is scanned with _SEVERITY_RE in C; no lines are JSON-decoded.
+    Results are cached per file path and modification time.
+
+    Args:
+        file_path (str): The path to the system_events.log file.
+
+    Returns:
+        list: Sorted event_type strings, or an empty list if the file is missing or empty.
+              Types that only occur earlier in the log are not included.
+    """
+    exists, mtime, size = _safe_stat(file_path)
+    if not exists or size == 0: # The log loaders report missing files
+        return []
+    return _load_system_event_types_cached(file_path, mtime)
+
+@st.cache_data(show_spinner=False)
+def _load_system_event_types_cached(file_path, mtime):
+    try:
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # A line cut off at the region start can't match: the pattern needs the whole key and value
+            start = max(0, len(mm) - _EVENT_TYPES_SCAN_BYTES)
+            event_types = {match.group(1) for match in _SEVERITY_RE.finditer(mm, start)}
+    except (OSError, ValueError): # ValueError: the file was emptied after the stat
+        return []
+    return sorted(event_type.decode('utf-8', 'replace') for event_type in event_types)
+
+def load_system_event_log(file_path, max_entries=None, severity_filter=None):
     """
     Safely loads and parses a line-delimited JSON system_events.log file.
+    Results are cached per file path and modification time.
 
     Args:
         file_path (str): The path to the system_events.log file.
+        max_entries (int, optional): If given, only the last max_entries entries are read,
+              scanning backwards from the end of the file. Defaults to None (read all entries).
+        severity_filter (set of bytes, optional): If given, only entries whose event_type is in the set
+              (e.g. {b"ERROR", b"WARNING"}) are returned; lines without a recognizable event_type
+              are always kept. Defaults to None (no filtering).
 
     Returns:
-        list: A list of parsed JSON objects (dicts), or an empty list if loading fails.
+        list: A list of parsed JSON objects (dicts) in file order, or an empty list if loading fails.
+              ISO-8601 'timestamp' values are parsed into UTC datetime objects. Lines that are not
+              JSON objects are skipped with a warning.
     """
+    exists, mtime, size = _safe_stat(file_path)
+    if not exists:
+        st.error(f"Error: System Event Log file not found at {file_path}. Please check the path.")
+        return []
+    if size == 0:
+        return []
+    if severity_filter is not None:
+        severity_filter = frozenset(severity_filter)
+    log_entries, messages = _load_system_event_log_cached(file_path, mtime, max_entries, severity_filter)
+    _show_messages(messages)
+    return log_entries
+
+@st.cache_data(show_spinner=False)
+def _load_system_event_log_cached(file_path, mtime, max_entries, severity_filter=None):
+    messages = []
     log_entries = []
     try:
-        with open(file_path, 'r') as f:
-            for line_number, line in enumerate(f, 1):
+        if max_entries is not None:
+            for line_number, line in enumerate(_iter_lines_reversed(file_path), 1):
+                if len(log_entries) >= max_entries:
+                    break
                 try:
-                    if line.strip(): # Ensure line is not empty
-                        log_entries.append(json.loads(line))
+                    if _keep_log_line(line, severity_filter): # Skips empty and filtered-out lines
+                        entry = _decode_log_line(line)
+                        if entry is None:
+                            messages.append(("warning", f"Warning: Line {line_number} counting from the end of {file_path} is not a JSON object. Skipping line."))
+                        else:
+                            log_entries.append(entry)
                 except json.JSONDecodeError:
-                    st.warning(f"Warning: Could not decode JSON from line {line_number} in {file_path}. Skipping line.")
-        return log_entries
+                    messages.append(("warning", f"Warning: Could not decode JSON from line {line_number} counting from the end of {file_path}. Skipping line."))
+            log_entries.reverse() # Back to chronological (file) order
+            return log_entries, messages
+
+        with open(file_path, 'rb') as f:
+            raw_lines = f.read().split(b'\n')
+        for line_number, line in enumerate(raw_lines, 1):
+            try:
+                if _keep_log_line(line, severity_filter): # Skips empty and filtered-out lines
+                    entry = _decode_log_line(line)
+                    if entry is None:
+                        messages.append(("warning", f"Warning: Line {line_number} in {file_path} is not a JSON object. Skipping line."))
+                    else:
+                        log_entries.append(entry)
+            except json.JSONDecodeError:
+                messages.append(("warning", f"Warning: Could not decode JSON from line {line_number} in {file_path}. Skipping line."))
+        return log_entries, messages
     except FileNotFoundError:
+        messages.append(("error", f"Error: System Event Log file not found at {file_path}. Please check the path."))
+        return [], messages
+    except Exception as e:
+        messages.append(("error", f"An unexpected error occurred while loading {file_path}: {e}"))
+        return [], messages
+
+# Columns Sophia_Alpha2 writes to system_events.log. Any other fields are inferred by Arrow.
+_LOG_SCHEMA = pa.schema([
+    ('timestamp', pa.timestamp('us', tz='UTC')),
+    ('event_type', pa.string()),
+    ('message', pa.string()),
+])
+
+# event_type has only a handful of distinct values (INFO/WARNING/ERROR), so it is stored dictionary-encoded
+_EVENT_TYPE_DICTIONARY_TYPE = pa.dictionary(pa.int16(), pa.string())
+
+def _encode_event_type(log_table):
+    """
+    Returns log_table with a string 'event_type' column dictionary-encoded, which shows up
+    as a pandas Categorical. Arrow's JSON reader can't produce dictionary columns directly,
+    so the column is cast in C after parsing. Tables without a string event_type are returned as-is.
+    """
+    index = log_table.schema.get_field_index('event_type')
+    if index == -1 or not pa.types.is_string(log_table.schema.field(index).type):
+        return log_table
+    try:
+        encoded = log_table.column(index).cast(_EVENT_TYPE_DICTIONARY_TYPE)
+    except pa.ArrowInvalid:
+        return log_table # More distinct values than int16 indices can hold
+    return log_table.set_column(index, 'event_type', encoded)
+
+def load_system_event_table(file_path, max_entries=None, severity_filter=None):
+    """
+    Loads a line-delimited JSON system_events.log file into a pyarrow Table.
+    Lines are parsed in a single pass by Arrow's native JSON reader instead of one
+    Python object per line. Results are cached per file path and modification time.
+
+    Args:
+        file_path (str): The path to the system_events.log file.
+        max_entries (int, optional): If given, only the last max_entries entries are read,
+              scanning backwards from the end of the file. Defaults to None (read all entries).
+        severity_filter (set of bytes, optional): If given, only entries whose event_type is in the set
+              (e.g. {b"ERROR", b"WARNING"}) are returned; lines without a recognizable event_type
+              are always kept. Defaults to None (no filtering).
+
+    Returns:
+        pa.Table: One row per log entry in file order, or an empty table if loading fails.
+                  'event_type' is dictionary-encoded.
+                  If any line is malformed, falls back to load_system_event_log's per-line parsing.
+    """
+    exists, mtime, size = _safe_stat(file_path)
+    if not exists:
         st.error(f"Error: System Event Log file not found at {file_path}. Please check the path.")
-        return []
+        return pa.table({})
+    if size == 0:
+        return pa.table({})
+    if severity_filter is not None:
+        severity_filter = frozenset(severity_filter)
+    log_table, messages = _load_system_event_table_cached(file_path, mtime, max_entries, severity_filter)
+    _show_messages(messages)
+    return log_table
+
+@st.cache_data(show_spinner=False)
+def _load_system_event_table_cached(file_path, mtime, max_entries, severity_filter=None):
+    messages = []
+    try:
+        if max_entries is not None:
+            tail_lines = []
+            for line in _iter_lines_reversed(file_path):
+                if len(tail_lines) >= max_entries:
+                    break
+                if _keep_log_line(line, severity_filter): # Skips empty and filtered-out lines
+                    tail_lines.append(line)
+            tail_lines.reverse() # Back to chronological (file) order
+            buffer = b'\n'.join(tail_lines)
+        else:
+            with open(file_path, 'rb') as f:
+                buffer = f.read()
+            if severity_filter is not None:
+                buffer = b'\n'.join(line for line in buffer.split(b'\n') if _keep_log_line(line, severity_filter))
+        if not buffer.strip():
+            # Nothing passed the filter; Arrow rejects an empty buffer, and the per-line fallback
+            # would only rescan the file to find nothing
+            return pa.table({}), messages
+        parse_options = paj.ParseOptions(explicit_schema=_LOG_SCHEMA, unexpected_field_behavior='infer')
+        log_table = paj.read_json(pa.BufferReader(buffer), parse_options=parse_options)
+        return _encode_event_type(log_table), messages
+    except pa.ArrowInvalid:
+        pass # Malformed line or unexpected value; the per-line parser below reports and skips bad lines
+    except FileNotFoundError:
+        messages.append(("error", f"Error: System Event Log file not found at {file_path}. Please check the path."))
+        return pa.table({}), messages
     except Exception as e:
-        st.error(f"An unexpected error occurred while loading {file_path}: {e}")
-        return []
+        messages.append(("error", f"An unexpected error occurred while loading {file_path}: {e}"))
+        return pa.table({}), messages
+
+    log_entries, messages = _load_system_event_log_cached(file_path, mtime, max_entries, severity_filter)
+    try:
+        return _encode_event_type(pa.Table.from_pylist(log_entries)), messages
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Fields with mixed types across entries; display them as strings
+        return pa.Table.from_pandas(pd.DataFrame(log_entries).astype(str), preserve_index=False), messages
+
+def _prefetch_ethics_df(file_path, mtime, min_events):
+    # The chart page only uses the DataFrame (and its Parquet side-file) from min_events up,
+    # so smaller DBs stop after the count. A current side-file is counted and read without the JSON
+    if _count_ethics_events_cached(file_path, mtime) >= min_events:
+        _build_ethics_df_cached(file_path, mtime)
+
+def _log_prefetch_failure(future):
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Background data prefetch failed", exc_info=exc)
+
+def prefetch_data(ethics_db_path, kg_path, system_log_path, max_log_entries=None, ethics_df_min_events=0):
+    """
+    Starts loading the ethics DB, knowledge graph and system event log concurrently in
+    background threads, so the disk reads and parsing overlap and later page visits hit
+    the cache. Returns immediately; missing files are skipped and reported by the pages.
+    If a page requests a file that is still being loaded, it waits for that load to finish.
+
+    Args:
+        ethics_db_path (str): The path to the ethics_db.json file.
+        kg_path (str): The path to the knowledge_graph.json file.
+        system_log_path (str): The path to the system_events.log file.
+        max_log_entries (int, optional): The max_entries the log viewer page loads with.
+        ethics_df_min_events (int, optional): The event count from which the trends page charts
+                                              via build_ethics_df; smaller DBs skip building it.
+
+    Returns:
+        list: The submitted concurrent.futures.Future objects, one per file load started.
+              Failed loads are logged.
+    """
+    jobs = [
+        # Both load the ethics DB JSON only when the Parquet side-file is stale or missing
+        (ethics_db_path, _load_ethics_trend_summary_cached, ()),
+        (ethics_db_path, _prefetch_ethics_df, (ethics_df_min_events,)),
+        (kg_path, _load_knowledge_graph_cached, ()),
+        # Arguments must match load_system_event_table's call exactly: st.cache_data keys on the
+        # arguments actually passed, so an omitted default severity_filter would be a different entry
+        (system_log_path, _load_system_event_table_cached, (max_log_entries, None)),
+        (system_log_path, _load_system_event_types_cached, ()),
+    ]
+    executor = ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix="sophia_prefetch")
+    futures = []
+    for file_path, cached_loader, extra_args in jobs:
+        exists, mtime, _ = _safe_stat(file_path)
+        if exists:
+            future = executor.submit(cached_loader, file_path, mtime, *extra_args)
+            future.add_done_callback(_log_prefetch_failure)
+            futures.append(future)
+    executor.shutdown(wait=False)
+    return futures
 
 if __name__ == '__main__':
     # Basic test cases (won't run in Streamlit context directly, but good for local testing)
@@ -127,11 +710,32 @@ if __name__ == '__main__':
 
     print("\n--- Testing load_system_event_log ---")
     log_data = load_system_event_log("dummy_system_events.log")
-    print(f"Loaded log data: {json.dumps(log_data, indent=2)}")
+    print(f"Loaded log data: {json.dumps(log_data, indent=2, default=str)}")
+    log_data_tail = load_system_event_log("dummy_system_events.log", max_entries=2)
+    print(f"Last 2 log entries: {json.dumps(log_data_tail, indent=2, default=str)}")
+    log_table = load_system_event_table("dummy_system_events.log")
+    print(f"Loaded log table (malformed line falls back to per-line parsing):\n{log_table}")
     log_data_missing = load_system_event_log("non_existent_log.log") # Test missing file
 
+    print("\n--- Testing prefetch_data ---")
+    for future in prefetch_data("dummy_ethics.json", "dummy_kg.json", "dummy_system_events.log",
+                                max_log_entries=2, ethics_df_min_events=256):
+        future.result()
+    # Two events are below ethics_df_min_events, so no DataFrame or Parquet side-file is built
+    assert not os.path.exists("dummy_ethics.parquet"), "prefetch_data built the ethics DataFrame for a small DB"
+    # The page's call must hit the prefetched cache entry rather than reading the log again.
+    # Rewrite the log but keep its mtime: a cache hit still returns the prefetched rows,
+    # while a miss would read the new content.
+    log_stat = os.stat("dummy_system_events.log")
+    with open("dummy_system_events.log", "w") as f:
+        f.write('{"timestamp": "2023-01-01T11:00:00Z", "event_type": "INFO", "message": "Rewritten"}\n')
+    os.utime("dummy_system_events.log", ns=(log_stat.st_atime_ns, log_stat.st_mtime_ns))
+    page_table = load_system_event_table("dummy_system_events.log", max_entries=2, severity_filter=None)
+    assert page_table.column('message').to_pylist() == ["Low disk space", "Critical failure"], \
+        "load_system_event_table did not reuse the prefetched log table"
+    print("Page call reused the prefetched log table.")
+
     # Clean up dummy files
-    import os
     os.remove("dummy_ethics.json")
     os.remove("dummy_kg.json")
     os.remove("dummy_system_events.log")